@@ -1,24 +1,55 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = ["snapconfig", "pyyaml", "python-dotenv"]
+# dependencies = ["snapconfig", "numpy", "orjson", "pyyaml", "python-dotenv"]
 # ///
 
+import argparse
+import hashlib
+import io
 import json
+import mmap
 import os
 import random
 import shutil
+import statistics
 import string
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial, wraps
+from itertools import repeat
 from pathlib import Path
 
 import snapconfig
 
+try:
+    import numpy as np
+    # The vectorized generators need the Generator API (NumPy >= 1.17).
+    HAS_NUMPY = hasattr(np.random, "default_rng")
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     import yaml
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
 
+if HAS_YAML:
+    try:
+        from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+        HAS_LIBYAML = True
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+        HAS_LIBYAML = False
+
 try:
     from dotenv import dotenv_values
     HAS_DOTENV = True
@@ -32,8 +63,35 @@ except ImportError:
     HAS_TOMLLIB = False
 
 
+SEED = 20240101
+GEN_CACHE_DIR = "_gencache"
+
+# Editing this script or installing a different backend changes the generated
+# bytes, so payloads are cached under a directory named for both; directories
+# left over from other versions are pruned at startup.
+BACKENDS = (HAS_NUMPY, HAS_ORJSON, HAS_YAML and HAS_LIBYAML)
+GEN_FINGERPRINT = hashlib.blake2b(Path(__file__).read_bytes() + repr(BACKENDS).encode(), digest_size=16).hexdigest()
+
+# 64 characters, so a random byte maps onto it exactly with `& 63`.
+ALPHABET = string.ascii_letters + string.digits + "-_"
+ALPHABET_TABLE = bytes(ALPHABET.encode("ascii")[b & 63] for b in range(256))
+
+if HAS_NUMPY:
+    ALPHABET_ARRAY = np.frombuffer(ALPHABET.encode("ascii"), dtype="S1")
+
+
 def random_string(length: int = 10) -> str:
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    raw = random.getrandbits(8 * length).to_bytes(length, "little")
+    return raw.translate(ALPHABET_TABLE).decode("ascii")
+
+
+def random_strings(n: int, length: int = 10) -> list:
+    if not HAS_NUMPY:
+        return [random_string(length) for _ in range(n)]
+    rng = np.random.default_rng(random.getrandbits(64))
+    idx = rng.integers(0, len(ALPHABET_ARRAY), size=(n, length), dtype=np.uint8)
+    rows = ALPHABET_ARRAY[idx].tobytes()
+    return [rows[i:i + length].decode("ascii") for i in range(0, n * length, length)]
 
 
 def format_size(bytes_size: int) -> str:
@@ -44,6 +102,10 @@ def format_size(bytes_size: int) -> str:
     return f"{bytes_size:.1f}GB"
 
 
+def format_spread(stdev: float, mean: float) -> str:
+    return f"±{stdev / mean:.0%}" if mean > 0 else "±0%"
+
+
 def format_time(seconds: float) -> str:
     if seconds < 0.001:
         return f"{seconds * 1_000_000:.1f}µs"
@@ -52,8 +114,15 @@ def format_time(seconds: float) -> str:
     return f"{seconds:.2f}s"
 
 
+def gen_scores(n: int) -> list:
+    if HAS_NUMPY:
+        return np.random.default_rng(random.getrandbits(64)).random(n).tolist()
+    rand = random.random
+    return [rand() for _ in range(n)]
+
+
 def gen_flat(n: int) -> dict:
-    return {f"key_{i}": random_string(20) for i in range(n)}
+    return {f"key_{i}": val for i, val in enumerate(random_strings(n, 20))}
 
 
 def gen_nested(depth: int, breadth: int) -> dict:
@@ -65,33 +134,56 @@ def gen_nested(depth: int, breadth: int) -> dict:
 
 
 def gen_array(n: int) -> dict:
+    names = random_strings(n, 15)
+    scores = gen_scores(n)
+    # Expand one big random int through its binary string; shifting it once
+    # per element would be quadratic in n.
+    actives = [bit == "1" for bit in format(random.getrandbits(n), f"0{n}b")]
     return {
         "items": [
-            {"id": i, "name": random_string(15), "score": random.random(), "active": random.choice([True, False])}
+            {"id": i, "name": names[i], "score": scores[i], "active": actives[i]}
             for i in range(n)
         ]
     }
 
 
 def gen_package_lock(packages: int) -> dict:
+    names = random_strings(packages, 12)
+    scopes = random_strings(packages, 12)
+    tarballs = random_strings(packages, 12)
+    hashes = random_strings(packages, 86)
+    dep_counts = [random.randint(0, 5) for _ in range(packages)]
+    dep_names = iter(random_strings(sum(dep_counts), 10))
     return {
         "name": "test-project",
         "version": "1.0.0",
         "lockfileVersion": 3,
         "packages": {
-            f"node_modules/{random_string(12)}": {
+            f"node_modules/{names[i]}": {
                 "version": f"{random.randint(1,20)}.{random.randint(0,99)}.{random.randint(0,99)}",
-                "resolved": f"https://registry.npmjs.org/{random_string(12)}/-/{random_string(12)}-1.0.0.tgz",
-                "integrity": f"sha512-{random_string(86)}",
-                "dependencies": {random_string(10): f"^{random.randint(1,5)}.0.0" for _ in range(random.randint(0, 5))}
+                "resolved": f"https://registry.npmjs.org/{scopes[i]}/-/{tarballs[i]}-1.0.0.tgz",
+                "integrity": f"sha512-{hashes[i]}",
+                "dependencies": {next(dep_names): f"^{random.randint(1,5)}.0.0" for _ in range(dep_counts[i])}
             }
-            for _ in range(packages)
+            for i in range(packages)
         }
     }
 
 
-def gen_env(n: int) -> str:
-    lines = []
+def text_generator(gen):
+    """Let a generator that writes to ``out`` also be called for a string."""
+    @wraps(gen)
+    def wrapper(*args, out=None, **kwargs):
+        if out is not None:
+            return gen(*args, out=out, **kwargs)
+        buf = io.StringIO()
+        gen(*args, out=buf, **kwargs)
+        return buf.getvalue()
+    return wrapper
+
+
+@text_generator
+def gen_env(n: int, out) -> None:
     for i in range(n):
         val_type = random.choice(["str", "num", "bool"])
         if val_type == "str":
@@ -100,96 +192,170 @@ def gen_env(n: int) -> str:
             val = str(random.randint(1, 10000))
         else:
             val = random.choice(["true", "false"])
-        lines.append(f"VAR_{i}={val}")
-    return "\n".join(lines)
+        out.write(f"VAR_{i}={val}\n")
 
 
-def gen_ini(sections: int, keys: int) -> str:
-    lines = []
+@text_generator
+def gen_ini(sections: int, keys: int, out) -> None:
     for s in range(sections):
-        lines.append(f"[section_{s}]")
+        out.write(f"[section_{s}]\n")
         for k in range(keys):
-            lines.append(f"key_{k} = {random_string(20)}")
-        lines.append("")
-    return "\n".join(lines)
+            out.write(f"key_{k} = {random_string(20)}\n")
+        out.write("\n")
 
 
-def gen_toml(tables: int, keys: int) -> str:
-    lines = []
+@text_generator
+def gen_toml(tables: int, keys: int, out) -> None:
     for t in range(tables):
-        lines.append(f"[table_{t}]")
+        out.write(f"[table_{t}]\n")
         for k in range(keys):
-            lines.append(f'key_{k} = "{random_string(20)}"')
-        lines.append("")
-    return "\n".join(lines)
+            out.write(f'key_{k} = "{random_string(20)}"\n')
+        out.write("\n")
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_text(path):
+    with open(path) as f:
+        return f.read()
 
 
-def benchmark(load_fn, path, iterations=10, warmup=2):
+def benchmark(load_fn, path, target_s=0.2, warmup=2, prepare=None, min_iterations=5, max_iterations=10_000):
+    # `prepare` runs once, outside the timed region, e.g. to read the file
+    # so only parsing is measured.
+    arg = prepare(path) if prepare else path
     for _ in range(warmup):
-        load_fn(path)
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        load_fn(path)
-        times.append(time.perf_counter() - start)
-    return min(times), sum(times) / len(times)
+        load_fn(arg)
+
+    # Time one pilot call and pick an iteration count that fills target_s:
+    # many runs for fast loads, just a few for slow ones.
+    start = time.perf_counter_ns()
+    load_fn(arg)
+    pilot = time.perf_counter_ns() - start
+    iterations = max(min_iterations, min(max_iterations, int(target_s * 1e9 / max(pilot, 1))))
+
+    times = [0] * iterations
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        load_fn(arg)
+        times[i] = time.perf_counter_ns() - start
+    return min(times) / 1e9, sum(times) / len(times) / 1e9, statistics.stdev(times) / 1e9
 
 
 def benchmark_cold(load_fn, path, clear_fn, iterations=5):
-    times = []
-    for _ in range(iterations):
+    times = [0] * iterations
+    for i in range(iterations):
         clear_fn()
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         load_fn(path)
-        times.append(time.perf_counter() - start)
-    return min(times), sum(times) / len(times)
+        times[i] = time.perf_counter_ns() - start
+    return min(times) / 1e9, sum(times) / len(times) / 1e9
 
 
-def run_benchmark(name, data, test_dir, fmt="json"):
-    path = test_dir / f"{name}.{fmt}"
+def mmap_read(path):
+    # Map the file the way snapconfig does and fault in every page by touching
+    # one byte of each, without copying the contents. The map is closed every
+    # call so each iteration starts from the same state.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return sum(m[i] for i in range(0, len(m), mmap.PAGESIZE))
 
-    if fmt == "json":
-        with open(path, "w") as f:
-            json.dump(data, f)
-    elif fmt == "yaml" and HAS_YAML:
-        with open(path, "w") as f:
-            yaml.dump(data, f)
-    elif fmt in ("env", "ini", "toml"):
+
+def evict_page_cache(path):
+    # Drop the file from the OS page cache, so the next read really comes from
+    # disk. Flush first: dirty pages are not evicted. A no-op where
+    # posix_fadvise is missing (e.g. macOS).
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def cold_clear(path):
+    snapconfig.clear_cache(path)
+    evict_page_cache(path)
+
+
+def load_from_path(load_fn, prepare, path):
+    return load_fn(prepare(path) if prepare else path)
+
+
+def write_payload(path, gen, fmt):
+    if fmt in ("env", "ini", "toml"):
         with open(path, "w") as f:
-            f.write(data)
+            gen(out=f)
+    elif fmt == "json" and HAS_ORJSON:
+        path.write_bytes(orjson.dumps(gen()))
+    elif fmt == "json":
+        path.write_text(json.dumps(gen()))
     else:
+        path.write_text(yaml.dump(gen(), Dumper=YamlDumper))
+
+
+def run_benchmark(name, gen, gen_args, test_dir, fmt="json", use_cache=True):
+    if fmt not in ("json", "yaml", "env", "ini", "toml") or (fmt == "yaml" and not HAS_YAML):
         return None
 
+    path = test_dir / f"{name}.{fmt}"
+
+    # Generated payloads are keyed by everything that determines their content,
+    # so repeated runs can copy the bytes instead of regenerating them.
+    key = repr((name, fmt, SEED, gen.__name__, gen_args)).encode()
+    cached_payload = test_dir / GEN_CACHE_DIR / GEN_FINGERPRINT / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.bytes"
+
+    if use_cache and cached_payload.exists():
+        shutil.copyfile(cached_payload, path)
+    else:
+        # Every generator draws from `random`, and NumPy generators are seeded
+        # from it too, so this one seed makes the payload reproducible.
+        random.seed(f"{SEED}:{name}")
+        write_payload(path, partial(gen, *gen_args), fmt)
+        cached_payload.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, cached_payload)
+
     file_size = os.path.getsize(path)
     snapconfig.clear_cache(str(path))
 
-    if fmt == "json":
-        pkg_name = "json"
-        pkg_min, pkg_avg = benchmark(lambda p: json.load(open(p)), str(path))
+    if fmt == "json" and HAS_ORJSON:
+        pkg_name, pkg_load, pkg_prepare = "orjson", orjson.loads, read_bytes
+    elif fmt == "json":
+        pkg_name, pkg_load, pkg_prepare = "json", json.loads, read_bytes
     elif fmt == "yaml":
-        pkg_name = "pyyaml"
-        pkg_min, pkg_avg = benchmark(lambda p: yaml.safe_load(open(p)), str(path), iterations=5)
+        pkg_name = "pyyaml (C)" if HAS_LIBYAML else "pyyaml"
+        pkg_load, pkg_prepare = partial(yaml.load, Loader=YamlLoader), read_text
     elif fmt == "env" and HAS_DOTENV:
-        pkg_name = "python-dotenv"
-        pkg_min, pkg_avg = benchmark(lambda p: dotenv_values(p), str(path))
+        pkg_name, pkg_load, pkg_prepare = "python-dotenv", dotenv_values, None
     elif fmt == "toml" and HAS_TOMLLIB:
-        pkg_name = "tomllib"
-        pkg_min, pkg_avg = benchmark(lambda p: tomllib.load(open(p, "rb")), str(path))
+        pkg_name, pkg_load, pkg_prepare = "tomllib", tomllib.loads, read_text
     else:
-        pkg_name = "builtin"
-        pkg_min, pkg_avg = benchmark(lambda p: open(p).read(), str(path))
+        pkg_name, pkg_load, pkg_prepare = "mmap (raw)", mmap_read, None
+
+    # Warm: the package parses input already in memory.
+    pkg_min, pkg_avg, pkg_stdev = benchmark(pkg_load, str(path), prepare=pkg_prepare)
 
+    # Cold: both sides start from the path with the source evicted from the
+    # page cache, so the ratio compares like with like.
+    pkg_cold_min, pkg_cold_avg = benchmark_cold(
+        partial(load_from_path, pkg_load, pkg_prepare),
+        str(path),
+        partial(evict_page_cache, str(path)),
+        iterations=3
+    )
     cold_min, cold_avg = benchmark_cold(
-        lambda p: snapconfig.load(p),
+        snapconfig.load,
         str(path),
-        lambda: snapconfig.clear_cache(str(path)),
+        partial(cold_clear, str(path)),
         iterations=3
     )
 
-    snapconfig.load(str(path))
-    cached_min, cached_avg = benchmark(snapconfig.load, str(path), iterations=20)
+    cached_min, cached_avg, cached_stdev = benchmark(snapconfig.load, str(path))
 
-    speedup_cold = pkg_avg / cold_avg if cold_avg > 0 else 0
+    speedup_cold = pkg_cold_avg / cold_avg if cold_avg > 0 else 0
     speedup_cached = pkg_avg / cached_avg if cached_avg > 0 else 0
 
     return {
@@ -198,56 +364,105 @@ def run_benchmark(name, data, test_dir, fmt="json"):
         "size": file_size,
         "pkg_name": pkg_name,
         "pkg_time": pkg_avg,
+        "pkg_cold_time": pkg_cold_avg,
         "cold_time": cold_avg,
         "cached_time": cached_avg,
+        "pkg_stdev": pkg_stdev,
+        "cached_stdev": cached_stdev,
         "speedup_cold": speedup_cold,
         "speedup_cached": speedup_cached,
+        # Preformatted for print_table.
+        "size_str": format_size(file_size),
+        "pkg_time_str": f"{format_time(pkg_avg)} {format_spread(pkg_stdev, pkg_avg)}",
+        "pkg_cold_time_str": format_time(pkg_cold_avg),
+        "cold_time_str": format_time(cold_avg),
+        "cached_time_str": f"{format_time(cached_avg)} {format_spread(cached_stdev, cached_avg)}",
+        "speedup_cold_str": f"-{1/speedup_cold:.1f}x" if speedup_cold < 1 else f"+{speedup_cold:.0f}x",
+        "speedup_cached_str": f"+{speedup_cached:.0f}x",
     }
 
 
+def warm_parsers():
+    # Pay one-time parser initialization before anything is timed.
+    if HAS_YAML:
+        yaml.load("a: 1", Loader=YamlLoader)
+    if HAS_TOMLLIB:
+        tomllib.loads("a = 1")
+
+
 def print_table(results):
-    h = ["Test", "Size", "Package", "Pkg Time", "Cold (sc)", "Cached (sc)", "Cold Speedup", "Cached Speedup"]
-    w = [16, 7, 14, 10, 10, 11, 12, 14]
+    h = ["Test", "Size", "Package", "Pkg Time", "Pkg Cold", "Cold (sc)", "Cached (sc)", "Cold Speedup", "Cached Speedup"]
+    w = [16, 7, 14, 14, 10, 10, 14, 12, 14]
+
+    row_fmt = "│ " + " │ ".join(f"{{:<{x}}}" for x in w) + " │"
 
     def row(cells):
-        return "│ " + " │ ".join(f"{c:<{w[i]}}" if i < len(w) else c for i, c in enumerate(cells)) + " │"
+        return row_fmt.format(*cells)
 
     def sep(char, join):
         return join.join(char * (x + 2) for x in w)
 
-    print("\n┌" + sep("─", "┬") + "┐")
-    print(row(h))
-    print("├" + sep("─", "┼") + "┤")
+    out = ["", "┌" + sep("─", "┬") + "┐", row(h), "├" + sep("─", "┼") + "┤"]
 
     for r in results:
-        if r['speedup_cold'] < 1:
-            cold_spd = f"-{1/r['speedup_cold']:.1f}x"
-        else:
-            cold_spd = f"+{r['speedup_cold']:.0f}x"
-        cached_spd = f"+{r['speedup_cached']:.0f}x"
         cells = [
             r['name'],
-            format_size(r['size']),
+            r['size_str'],
             r['pkg_name'],
-            format_time(r['pkg_time']),
-            format_time(r['cold_time']),
-            format_time(r['cached_time']),
-            cold_spd,
-            cached_spd,
+            r['pkg_time_str'],
+            r['pkg_cold_time_str'],
+            r['cold_time_str'],
+            r['cached_time_str'],
+            r['speedup_cold_str'],
+            r['speedup_cached_str'],
         ]
-        print(row(cells))
-
-    print("└" + sep("─", "┴") + "┘")
-    print(f"\n  sc = snapconfig")
-    print(f"  Cold   = first load (parse + write cache)")
-    print(f"  Cached = subsequent loads (mmap only)")
-    print(f"  +Nx = snapconfig N times faster, -Nx = snapconfig N times slower")
+        out.append(row(cells))
+
+    out.extend([
+        "└" + sep("─", "┴") + "┘",
+        "",
+        "  sc = snapconfig",
+        "  Pkg Time = package parsing input already read into memory (python-dotenv and mmap (raw) read the file themselves)",
+        "  Pkg Cold = package reading the file and parsing it",
+        "  Cold     = snapconfig first load (read + parse + write cache)",
+        "  Cached   = snapconfig subsequent loads (mmap only)",
+        "  Pkg Cold and Cold start " + (
+            "with the source evicted from the page cache, so both include a disk read"
+            if hasattr(os, "posix_fadvise")
+            else "with the source still in the page cache (no posix_fadvise on this platform)"
+        ),
+        "  Cold Speedup = Pkg Cold / Cold, Cached Speedup = Pkg Time / Cached",
+        "  ±N% = standard deviation of the timed runs, relative to the average",
+        "  +Nx = snapconfig N times faster, -Nx = snapconfig N times slower",
+    ])
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Benchmark snapconfig against standard config parsers.")
+    parser.add_argument("--no-cache", action="store_true", help="regenerate test payloads instead of reusing cached ones")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="run tests in a process pool; faster, but timings are noisier, so collect published numbers serially",
+    )
+    args = parser.parse_args()
+
+    warm_parsers()
+
     test_dir = Path(".snapconfig_bench")
     test_dir.mkdir(exist_ok=True)
 
+    gen_cache = test_dir / GEN_CACHE_DIR
+    if gen_cache.is_dir():
+        for p in gen_cache.iterdir():
+            if p.name == GEN_FINGERPRINT:
+                continue
+            if p.is_dir():
+                shutil.rmtree(p)
+            else:
+                p.unlink()
+
     print("=" * 85)
     print("SNAPCONFIG BENCHMARK")
     print("=" * 85)
@@ -256,46 +471,67 @@ def main():
 
     tests = [
         # JSON - 1KB to 10MB
-        ("json_1kb", gen_flat(30), "json"),
-        ("json_10kb", gen_flat(300), "json"),
-        ("json_100kb", gen_flat(3000), "json"),
-        ("json_1mb", gen_flat(30000), "json"),
-        ("json_5mb", gen_array(60000), "json"),
-        ("json_10mb", gen_array(120000), "json"),
+        ("json_1kb", gen_flat, (30,), "json"),
+        ("json_10kb", gen_flat, (300,), "json"),
+        ("json_100kb", gen_flat, (3000,), "json"),
+        ("json_1mb", gen_flat, (30000,), "json"),
+        ("json_5mb", gen_array, (60000,), "json"),
+        ("json_10mb", gen_array, (120000,), "json"),
     ]
 
     if HAS_YAML:
         tests.extend([
             # YAML - 1KB to 100KB (YAML is slow, skip larger)
-            ("yaml_1kb", gen_flat(30), "yaml"),
-            ("yaml_10kb", gen_flat(300), "yaml"),
-            ("yaml_100kb", gen_flat(3000), "yaml"),
+            ("yaml_1kb", gen_flat, (30,), "yaml"),
+            ("yaml_10kb", gen_flat, (300,), "yaml"),
+            ("yaml_100kb", gen_flat, (3000,), "yaml"),
         ])
 
     if HAS_DOTENV:
         tests.extend([
             # ENV - 1KB to 20KB
-            ("env_1kb", gen_env(50), "env"),
-            ("env_20kb", gen_env(1000), "env"),
+            ("env_1kb", gen_env, (50,), "env"),
+            ("env_20kb", gen_env, (1000,), "env"),
         ])
 
     if HAS_TOMLLIB:
         tests.extend([
             # TOML - 5KB to 80KB
-            ("toml_5kb", gen_toml(10, 20), "toml"),
-            ("toml_80kb", gen_toml(50, 50), "toml"),
+            ("toml_5kb", gen_toml, (10, 20), "toml"),
+            ("toml_80kb", gen_toml, (50, 50), "toml"),
         ])
 
+    tests.extend([
+        # INI - 5KB to 80KB, against a raw mmap read of the file: a lower bound
+        # on any loader, not a parser comparison
+        ("ini_5kb", gen_ini, (10, 15), "ini"),
+        ("ini_80kb", gen_ini, (50, 50), "ini"),
+    ])
+
     print(f"\nRunning {len(tests)} benchmarks...\n")
 
-    for name, data, fmt in tests:
-        print(f"  {name}...", end=" ", flush=True)
-        result = run_benchmark(name, data, test_dir, fmt)
-        if result:
-            results.append(result)
-            print(f"{result['speedup_cached']:.0f}x faster (cached) than {result['pkg_name']}")
-        else:
-            print("skipped")
+    if args.parallel:
+        # Half the cores, so workers don't contend with each other for CPU.
+        pool = ProcessPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            initializer=warm_parsers,
+        )
+        mapper = pool.map
+    else:
+        pool = nullcontext()
+        mapper = map
+
+    names, gens, gen_args, fmts = zip(*tests)
+    with pool:
+        outcomes = mapper(run_benchmark, names, gens, gen_args, repeat(test_dir), fmts, repeat(not args.no_cache))
+        for name in names:
+            print(f"  {name}...", end=" ", flush=True)
+            result = next(outcomes)
+            if result:
+                results.append(result)
+                print(f"{result['speedup_cached']:.0f}x faster (cached) than {result['pkg_name']}")
+            else:
+                print("skipped")
 
     print("\n" + "=" * 85)
     print("RESULTS")
@@ -307,9 +543,10 @@ def main():
     print("SUMMARY BY FORMAT")
     print("=" * 85)
 
-    for fmt, pkg in [("json", "json"), ("yaml", "pyyaml"), ("env", "python-dotenv"), ("toml", "tomllib")]:
+    for fmt in ["json", "yaml", "env", "toml", "ini"]:
         fmt_results = [r for r in results if r["fmt"] == fmt]
         if fmt_results:
+            pkg = fmt_results[0]["pkg_name"]
             cold_speedups = [r["speedup_cold"] for r in fmt_results]
             cached_speedups = [r["speedup_cached"] for r in fmt_results]
             print(f"\n{fmt.upper()} vs {pkg}:")
@@ -330,12 +567,12 @@ def main():
 Total benchmarks: {len(results)}
 Size range: {format_size(min(sizes))} - {format_size(max(sizes))}
 
-Cold speedup (first load vs package):
+Cold speedup (first load vs package reading the file):
   Min:     {min(cold_speedups):,.1f}x
   Max:     {max(cold_speedups):,.0f}x
   Average: {sum(cold_speedups)/len(cold_speedups):,.1f}x
 
-Cached speedup (subsequent loads vs package):
+Cached speedup (subsequent loads vs package parsing from memory):
   Min:     {min(cached_speedups):,.0f}x
   Max:     {max(cached_speedups):,.0f}x
   Average: {sum(cached_speedups)/len(cached_speedups):,.0f}x
@@ -361,7 +598,10 @@ Best for:
   - Serverless cold starts
 """)
 
-    shutil.rmtree(test_dir)
+    # Keep the payload cache around for the next run.
+    for p in test_dir.iterdir():
+        if p.name != GEN_CACHE_DIR:
+            p.unlink()
 
 
 if __name__ == "__main__":
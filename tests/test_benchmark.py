@@ -0,0 +1,34 @@
+"""Tests for the payload generators in benchmark.py."""
+
+import importlib.util
+import io
+import os
+import random
+import pytest
+
+BENCHMARK_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "benchmark.py")
+spec = importlib.util.spec_from_file_location("benchmark", BENCHMARK_PATH)
+benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark)
+
+
+@pytest.mark.parametrize("gen, args", [
+    (benchmark.gen_env, (20,)),
+    (benchmark.gen_ini, (3, 4)),
+    (benchmark.gen_toml, (3, 4)),
+])
+def test_text_generator_string_matches_stream(gen, args):
+    random.seed(0)
+    text = gen(*args)
+    random.seed(0)
+    out = io.StringIO()
+    gen(*args, out=out)
+    assert out.getvalue() == text
+    assert text
+
+
+def test_text_generator_keyword_args():
+    random.seed(0)
+    positional = benchmark.gen_ini(2, 3)
+    random.seed(0)
+    assert benchmark.gen_ini(sections=2, keys=3) == positional
@@ -3,38 +3,51 @@
 import json
 import os
 import tempfile
+from pathlib import Path
 import pytest
 import snapconfig
 
 
-@pytest.fixture
+JSON_DATA = {
+    "string": "hello",
+    "integer": 42,
+    "float": 3.14,
+    "boolean": True,
+    "null": None,
+    "array": [1, 2, 3],
+    "nested": {
+        "key": "value",
+        "deep": {"level": 3}
+    }
+}
+
+
+# Sample files are written once per module and shared by the tests that only
+# read them; their caches are cleared when the module finishes.
+@pytest.fixture(scope="module")
 def temp_dir():
     with tempfile.TemporaryDirectory() as tmpdir:
         yield tmpdir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def json_file(temp_dir):
     path = os.path.join(temp_dir, "test.json")
-    data = {
-        "string": "hello",
-        "integer": 42,
-        "float": 3.14,
-        "boolean": True,
-        "null": None,
-        "array": [1, 2, 3],
-        "nested": {
-            "key": "value",
-            "deep": {"level": 3}
-        }
-    }
-    with open(path, "w") as f:
-        json.dump(data, f)
+    Path(path).write_text(json.dumps(JSON_DATA))
     yield path
     snapconfig.clear_cache(path)
 
 
 @pytest.fixture
+def disposable_json_file(temp_dir):
+    """A fresh copy of the JSON sample for tests that delete the source."""
+    path = os.path.join(temp_dir, "disposable.json")
+    Path(path).write_text(json.dumps(JSON_DATA))
+    yield path
+    snapconfig.clear_cache(path)
+
+
+@pytest.fixture(scope="module")
 def yaml_file(temp_dir):
     path = os.path.join(temp_dir, "test.yaml")
     content = """
@@ -52,13 +65,12 @@ nested:
   deep:
     level: 3
 """
-    with open(path, "w") as f:
-        f.write(content)
+    Path(path).write_text(content)
     yield path
     snapconfig.clear_cache(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def toml_file(temp_dir):
     path = os.path.join(temp_dir, "test.toml")
     content = """
@@ -75,13 +87,12 @@ enabled = true
 [features]
 list = ["a", "b", "c"]
 """
-    with open(path, "w") as f:
-        f.write(content)
+    Path(path).write_text(content)
     yield path
     snapconfig.clear_cache(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ini_file(temp_dir):
     path = os.path.join(temp_dir, "test.ini")
     content = """
@@ -94,13 +105,12 @@ enabled = true
 type = redis
 ttl = 3600
 """
-    with open(path, "w") as f:
-        f.write(content)
+    Path(path).write_text(content)
     yield path
     snapconfig.clear_cache(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def env_file(temp_dir):
     path = os.path.join(temp_dir, ".env")
     content = """
@@ -119,8 +129,7 @@ TIMEOUT=30.5
 # Export syntax
 export EXPORTED_VAR=exported_value
 """
-    with open(path, "w") as f:
-        f.write(content)
+    Path(path).write_text(content)
     yield path
     snapconfig.clear_cache(path)
 
@@ -339,12 +348,12 @@ class TestCaching:
         assert "cache_fresh" not in info
         assert info["cache_path"].endswith(".snapconfig")
 
-    def test_cache_info_cache_only(self, json_file):
-        config = snapconfig.load(json_file)
+    def test_cache_info_cache_only(self, disposable_json_file):
+        config = snapconfig.load(disposable_json_file)
         assert os.path.exists(config.cache_path)
-        os.remove(json_file)
+        os.remove(disposable_json_file)
 
-        info = snapconfig.cache_info(json_file)
+        info = snapconfig.cache_info(disposable_json_file)
         assert info["source_exists"] is False
         assert info["cache_exists"] is True
         assert info["cache_size"] > 0
@@ -373,12 +382,12 @@ class TestCaching:
         snapconfig.load(json_file, cache_path=custom_cache)
         assert os.path.exists(custom_cache)
 
-    def test_load_uses_cache_when_source_missing(self, json_file):
-        config = snapconfig.load(json_file)
+    def test_load_uses_cache_when_source_missing(self, disposable_json_file):
+        config = snapconfig.load(disposable_json_file)
         assert os.path.exists(config.cache_path)
-        os.remove(json_file)
+        os.remove(disposable_json_file)
 
-        cached = snapconfig.load(json_file)
+        cached = snapconfig.load(disposable_json_file)
         assert cached["string"] == "hello"
         assert cached.source_path is None
 